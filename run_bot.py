@@ -4,7 +4,7 @@ Simple script to run the Discord bot with token from secrets.py
 """
 import os
 import sys
-from discord_bot import bot
+from discord_bot import run_bot
 from secrets import DISCORD_TOKEN
 
 def main():
@@ -25,7 +25,7 @@ def main():
     print("Press Ctrl+C to stop the bot")
     
     try:
-        bot.run(token)
+        run_bot(token)
     except KeyboardInterrupt:
         print("\n👋 Bot stopped.")
     except Exception as e: